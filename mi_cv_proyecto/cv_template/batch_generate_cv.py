@@ -13,14 +13,27 @@ Notas:
 """
 
 import argparse
+import concurrent.futures
+import functools
+import hashlib
+import io
+import itertools
 import json
 import os
+import re
+import shutil
 import sys
+import tempfile
 import unicodedata
 from typing import Any, Dict, List, Optional, Tuple
 
 from generate_cv import construir_cv
 
+try:
+    import orjson  # opcional: parse/serialización JSON mucho más rápidos
+except Exception:
+    orjson = None
+
 PROJECT_ROOT = os.path.dirname(os.path.dirname(__file__))
 PROCESSED_DIRNAME = os.path.join(PROJECT_ROOT, 'output', '_photos_processed')
 DEFAULT_PHOTOS_DIR = os.path.join(PROJECT_ROOT, 'cv_template', 'assets', 'photos')
@@ -30,6 +43,9 @@ DEFAULT_INPUT = DEFAULT_PROFILES_FILE
 
 
 def load_json(path: str) -> Any:
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -42,14 +58,36 @@ def normalize_profiles(data: Any) -> List[Dict[str, Any]]:
     raise ValueError('El JSON debe ser una lista de perfiles o un objeto con clave "perfiles" (lista).')
 
 
-REQUIRED_KEYS = ['nombre','cargo', 'contacto', 'resumen', 'experiencias', 'educacion', 'habilidades', 'idiomas']
+REQUIRED_KEYS = ('nombre', 'cargo', 'contacto', 'resumen', 'experiencias', 'educacion', 'habilidades', 'idiomas')
+
+
+# vacíos del formato: ausencia, None, '' o lista vacía. Un dict vacío ({}) cuenta
+# como presente (sección declarada sin contenido), igual que en la validación original.
+_EMPTY_FIELD_VALUES = (None, '', [])
 
 
 def validate_profile(p: Dict[str, Any]) -> Tuple[bool, List[str]]:
-    missing = [k for k in REQUIRED_KEYS if k not in p or p[k] in (None, '', [])]
+    # p.get(k) cubre ausencia y valor en un solo lookup; la tupla de vacíos se
+    # construye una única vez a nivel de módulo, no en cada comparación.
+    missing = [k for k in REQUIRED_KEYS if p.get(k) in _EMPTY_FIELD_VALUES]
     return (len(missing) == 0, missing)
 
 
+@functools.lru_cache(maxsize=None)
+def _photo_files(photos_dir: str) -> Dict[str, str]:
+    """Mapa nombre_archivo_lower -> ruta completa. Un solo os.scandir por directorio;
+    las búsquedas posteriores son lookups en memoria, sin syscalls."""
+    files: Dict[str, str] = {}
+    try:
+        with os.scandir(photos_dir) as it:
+            for entry in it:
+                if entry.is_file():
+                    files[entry.name.lower()] = entry.path
+    except OSError:
+        pass
+    return files
+
+
 def resolve_photo_path(ruta: Optional[str]) -> Optional[str]:
     if not ruta:
         return None
@@ -59,7 +97,9 @@ def resolve_photo_path(ruta: Optional[str]) -> Optional[str]:
     candidate = os.path.join(PROJECT_ROOT, ruta)
     if os.path.exists(candidate):
         return candidate
-    # relativa a assets/photos
+    # relativa a assets/photos: lookup en el índice cacheado (sin stat extra)
+    if os.sep not in ruta and '/' not in ruta:
+        return _photo_files(DEFAULT_PHOTOS_DIR).get(ruta.lower())
     candidate2 = os.path.join(DEFAULT_PHOTOS_DIR, ruta)
     return candidate2 if os.path.exists(candidate2) else None
 
@@ -68,6 +108,9 @@ def ensure_dir(path: str):
     os.makedirs(path, exist_ok=True)
 
 
+# El resultado de estos sondeos de import es estable durante la vida del proceso;
+# memoizarlos evita re-ejecutar try/except import en cada foto/fila.
+@functools.lru_cache(maxsize=1)
 def try_import_pillow():
     try:
         from PIL import Image  # noqa: F401
@@ -76,25 +119,85 @@ def try_import_pillow():
         return False
 
 
+@functools.lru_cache(maxsize=1)
+def try_import_pyvips():
+    try:
+        import pyvips  # noqa: F401
+        return True
+    except Exception:
+        return False
+
+
+def _preprocess_photo_pyvips(src_path: str, out_path: str, target_size_px: int, max_bytes: int) -> str:
+    """Ruta rápida con libvips: decodifica en streaming (sin materializar la imagen
+    completa), recorta centrado + redimensiona en C y codifica JPEG con libjpeg-turbo."""
+    import pyvips
+
+    im = pyvips.Image.thumbnail(src_path, target_size_px, height=target_size_px, crop='centre')
+    # misma calibración lineal de calidad que la ruta Pillow, pero en buffers
+    buf = im.jpegsave_buffer(Q=75, strip=True)
+    size = len(buf)
+    quality = max(40, min(95, round(75 * max_bytes / size))) if size else 95
+    buf = im.jpegsave_buffer(Q=quality, strip=True)
+    while len(buf) > max_bytes and quality > 40:
+        quality = max(40, quality - 5)
+        buf = im.jpegsave_buffer(Q=quality, strip=True)
+    fd, tmp_path = tempfile.mkstemp(suffix='.jpg', dir=os.path.dirname(out_path))
+    os.close(fd)
+    im.jpegsave(tmp_path, Q=quality, optimize_coding=True, strip=True, interlace=True)
+    # os.replace atómico: si dos perfiles comparten foto, nunca se lee a medio escribir
+    os.replace(tmp_path, out_path)
+    return out_path
+
+
 def preprocess_photo(src_path: str, target_dir: str, target_size_px: int = 600, max_bytes: int = 200 * 1024) -> str:
     """
     - Convierte a RGB
     - Recorta centrado a cuadrado 1:1
     - Redimensiona a target_size_px x target_size_px
-    - Comprime JPEG buscando <= max_bytes (calidad binaria 95..40)
+    - Comprime JPEG buscando <= max_bytes (calibración + interpolación de calidad 40..95)
     - Retorna la ruta del archivo procesado (JPG)
+
+    Usa pyvips si está instalado (más rápido y con menor pico de memoria); si no, Pillow.
     """
+    ensure_dir(target_dir)
+
+    base = os.path.splitext(os.path.basename(src_path))[0]
+    # hash corto de la ruta fuente: dos orígenes distintos con el mismo basename
+    # no comparten archivo de salida al procesarse en paralelo
+    src_tag = hashlib.blake2b(os.path.abspath(src_path).encode('utf-8'), digest_size=4).hexdigest()
+    out_path = os.path.join(target_dir, f"{base}_{target_size_px}_{src_tag}.jpg")
+
+    # Vía rápida: si la fuente ya es un JPEG cuadrado <= target_size_px y <= max_bytes,
+    # basta copiarla; Image.open solo lee la cabecera, así que el chequeo es barato.
+    if src_path.lower().endswith(('.jpg', '.jpeg')) and try_import_pillow():
+        try:
+            if os.path.getsize(src_path) <= max_bytes:
+                from PIL import Image
+                with Image.open(src_path) as im:
+                    w, h = im.size
+                if w == h and w <= target_size_px:
+                    fd, tmp_path = tempfile.mkstemp(suffix='.jpg', dir=target_dir)
+                    os.close(fd)
+                    shutil.copyfile(src_path, tmp_path)
+                    os.replace(tmp_path, out_path)
+                    return out_path
+        except Exception:
+            pass
+
+    if try_import_pyvips():
+        try:
+            return _preprocess_photo_pyvips(src_path, out_path, target_size_px, max_bytes)
+        except Exception as e:
+            print(f"[WARN] pyvips no pudo procesar '{src_path}': {e}. Se usará Pillow.")
+
     if not try_import_pillow():
         raise RuntimeError(
-            'Pillow no está instalado. Instálalo manualmente (pip install Pillow) o ejecuta sin --process-photos.'
+            'Pillow no está instalado. Instálalo manualmente (pip install Pillow), '
+            'o instala pyvips, o ejecuta sin --process-photos.'
         )
     from PIL import Image
 
-    ensure_dir(target_dir)
-
-    base = os.path.splitext(os.path.basename(src_path))[0]
-    out_path = os.path.join(target_dir, f"{base}_{target_size_px}.jpg")
-
     # Determinar filtro de remuestreo compatible con Pillow>=10 y anteriores
     try:
         resample = Image.Resampling.LANCZOS  # Pillow >= 10
@@ -102,7 +205,14 @@ def preprocess_photo(src_path: str, target_dir: str, target_size_px: int = 600,
         resample = getattr(Image, 'LANCZOS', getattr(Image, 'ANTIALIAS', 1))
 
     with Image.open(src_path) as im:
-        im = im.convert('RGB')
+        # draft: en JPEG decodifica a escala reducida (1/2, 1/4, 1/8) dentro de libjpeg,
+        # así una fuente de 4800x3600 no se materializa a resolución completa para
+        # terminar en 600x600 (no-op para PNG/WebP)
+        im.draft('RGB', (target_size_px * 2, target_size_px * 2))
+        # convertir solo si hace falta: la copia completa de píxeles es gratis de evitar
+        # cuando la fuente ya es RGB (el caso común en JPEG)
+        if im.mode != 'RGB':
+            im = im.convert('RGB')
         w, h = im.size
         # recorte centrado a cuadrado
         if w != h:
@@ -113,19 +223,27 @@ def preprocess_photo(src_path: str, target_dir: str, target_size_px: int = 600,
         # redimensionar
         im = im.resize((target_size_px, target_size_px), resample=resample)
 
-        # compresión: búsqueda binaria de calidad
-        low, high = 40, 95
-        best_quality = high
-        while low <= high:
-            q = (low + high) // 2
-            im.save(out_path, format='JPEG', quality=q, optimize=True)
-            size = os.path.getsize(out_path)
-            if size <= max_bytes:
-                best_quality = q
-                low = q + 1
-            else:
-                high = q - 1
-        im.save(out_path, format='JPEG', quality=best_quality, optimize=True)
+        # compresión: el tamaño del JPEG es ~lineal en la calidad dentro de 40..95,
+        # así que basta una codificación de calibración en memoria + interpolación,
+        # en lugar de una búsqueda binaria con ~7 codificaciones a disco.
+        buf = io.BytesIO()
+        im.save(buf, format='JPEG', quality=75, optimize=False)
+        size = buf.tell()
+        quality = max(40, min(95, round(75 * max_bytes / size))) if size else 95
+        # verificación única; si quedó por encima del límite, bajar de a 5
+        buf = io.BytesIO()
+        im.save(buf, format='JPEG', quality=quality, optimize=False)
+        while buf.tell() > max_bytes and quality > 40:
+            quality = max(40, quality - 5)
+            buf = io.BytesIO()
+            im.save(buf, format='JPEG', quality=quality, optimize=False)
+        # única escritura a disco (optimize=True reduce aún más el tamaño estimado);
+        # tmp + os.replace atómico: dos perfiles con la misma foto nunca dejan
+        # un JPEG truncado aunque la preparen en paralelo
+        fd, tmp_path = tempfile.mkstemp(suffix='.jpg', dir=target_dir)
+        os.close(fd)
+        im.save(tmp_path, format='JPEG', quality=quality, optimize=True, progressive=True)
+        os.replace(tmp_path, out_path)
 
     return out_path
 
@@ -134,13 +252,20 @@ def preprocess_photo(src_path: str, target_dir: str, target_size_px: int = 600,
 # Carga desde Excel
 # ------------------
 
+@functools.lru_cache(maxsize=1)
 def _import_pandas_openpyxl():
     try:
         import pandas as pd  # noqa: F401
-        import openpyxl  # noqa: F401
-        return True
     except Exception:
         return False
+    # basta un motor de lectura: calamine (más rápido, opcional) u openpyxl
+    for mod in ('python_calamine', 'openpyxl'):
+        try:
+            __import__(mod)
+            return True
+        except Exception:
+            continue
+    return False
 
 
 def _to_bool(val: Any) -> bool:
@@ -152,15 +277,17 @@ def _to_bool(val: Any) -> bool:
     return s in ('1', 'true', 'sí', 'si', 'y', 'yes', 'x')
 
 
+# admitir separadores ; , o salto de línea (consecutivos colapsan solos)
+_LIST_SEP = re.compile(r'[;,\n]+')
+
+
 def _split_list(val: Any) -> List[str]:
     if val is None:
         return []
     s = str(val).strip()
     if not s:
         return []
-    # admitir separadores ; o ,
-    parts = [p.strip() for p in s.replace('\n', ';').replace(',', ';').split(';')]
-    return [p for p in parts if p]
+    return [p for p in (part.strip() for part in _LIST_SEP.split(s)) if p]
 
 
 def _parse_idiomas(val: Any) -> Dict[str, str]:
@@ -237,65 +364,71 @@ def _parse_educacion(row: Dict[str, Any]) -> List[Dict[str, Any]]:
     return [{'grado': grado, 'institucion': inst, 'detalle': detalle}]
 
 
+# tablas precompiladas para _slug (separadores -> guion, limpieza y colapso en C)
+_SLUG_SEPS = str.maketrans(' _', '--')
+_SLUG_INVALID = re.compile(r'[^a-z0-9-]+')
+_SLUG_COLLAPSE = re.compile(r'-{2,}')
+
+
+@functools.lru_cache(maxsize=4096)
 def _slug(s: str) -> str:
-    s = unicodedata.normalize('NFKD', s)
-    s = ''.join(c for c in s if not unicodedata.combining(c))
-    s = s.lower().strip()
-    # quitar caracteres no alfanuméricos
-    out = []
-    for ch in s:
-        if ch.isalnum():
-            out.append(ch)
-        elif ch in (' ', '-', '_'):
-            out.append('-')
-    # colapsar guiones
-    slug = ''.join(out)
-    while '--' in slug:
-        slug = slug.replace('--', '-')
-    return slug.strip('-')
+    # NFKD + encode('ascii','ignore') descarta los combinantes sin bucle Python
+    s = unicodedata.normalize('NFKD', s).encode('ascii', 'ignore').decode('ascii')
+    s = s.lower().strip().translate(_SLUG_SEPS)
+    s = _SLUG_INVALID.sub('', s)
+    return _SLUG_COLLAPSE.sub('-', s).strip('-')
 
 
 def _find_photo_by_basename(photos_dir: str, base: str) -> Optional[str]:
     if not base:
         return None
+    files = _photo_files(photos_dir)
     stem, ext = os.path.splitext(base)
-    candidates: List[str] = []
     if ext:
-        p = os.path.join(photos_dir, base)
-        if os.path.exists(p):
-            return p
-    else:
-        for e in ('.png', '.jpg', '.jpeg', '.webp'):
-            p = os.path.join(photos_dir, stem + e)
-            if os.path.exists(p):
-                candidates.append(p)
-        if candidates:
-            # priorizar png/jpg
-            for pref in ('.png', '.jpg', '.jpeg', '.webp'):
-                for c in candidates:
-                    if c.lower().endswith(pref):
-                        return c
+        return files.get(base.lower())
+    # sin extensión: probar en orden de preferencia (png/jpg primero)
+    for e in ('.png', '.jpg', '.jpeg', '.webp'):
+        hit = files.get((stem + e).lower())
+        if hit:
+            return hit
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def _photo_slug_index(photos_dir: str) -> Tuple[Dict[str, str], Tuple[Tuple[str, str], ...]]:
+    """Índice (slug -> ruta) de las fotos de un directorio. Se construye una sola vez
+    por directorio, de modo que buscar fotos para N perfiles sea O(N+M) y no O(N·M)."""
+    exts = ('.png', '.jpg', '.jpeg', '.webp')
+    exact: Dict[str, str] = {}
+    entries: List[Tuple[str, str]] = []
+    for fn, path in _photo_files(photos_dir).items():
+        stem, ext = os.path.splitext(fn)  # fn ya viene en minúsculas
+        if ext in exts:
+            s_stem = _slug(stem)
+            if not s_stem:
+                # nombre de archivo no latinizable: sin slug no hay forma de casarlo
+                continue
+            exact.setdefault(s_stem, path)
+            entries.append((s_stem, path))
+    return exact, tuple(entries)
+
+
 def _find_photo_by_name_guess(photos_dir: str, nombre: str) -> Optional[str]:
     if not nombre:
         return None
     slug = _slug(nombre)
-    if not os.path.isdir(photos_dir):
-        return None
-    exts = ('.png', '.jpg', '.jpeg', '.webp')
-    try:
-        for fn in os.listdir(photos_dir):
-            stem, ext = os.path.splitext(fn)
-            if ext.lower() in exts:
-                s_stem = _slug(stem)
-                if slug in s_stem or s_stem in slug:
-                    cand = os.path.join(photos_dir, fn)
-                    if os.path.exists(cand):
-                        return cand
-    except Exception:
+    if not slug:
+        # nombres en alfabetos no latinos colapsan a '' tras el fold ASCII; un slug
+        # vacío es subcadena de todo y casaría con cualquier foto del índice
         return None
+    exact, entries = _photo_slug_index(photos_dir)
+    # coincidencia exacta O(1) antes del barrido por subcadenas
+    hit = exact.get(slug)
+    if hit:
+        return hit
+    for s_stem, path in entries:
+        if slug in s_stem or s_stem in slug:
+            return path
     return None
 
 
@@ -304,15 +437,26 @@ def load_profiles_from_excel(path: str, photos_dir: str = DEFAULT_PHOTOS_DIR) ->
         raise RuntimeError('Leer Excel requiere pandas y openpyxl. Instálalos manualmente: pip install pandas openpyxl')
     import pandas as pd
 
-    # Leer primera hoja
-    df = pd.read_excel(path)
+    # Leer primera hoja. El motor calamine (Rust) parsea .xlsx ~2x más rápido que
+    # openpyxl; se usa si está instalado y se cae a openpyxl/el default si no.
+    try:
+        df = pd.read_excel(path, engine='calamine')
+    except Exception:
+        try:
+            df = pd.read_excel(path, engine='openpyxl')
+        except ImportError:
+            df = pd.read_excel(path)
     # normalizar nombres de columnas a minúsculas sin espacios
     df.columns = [str(c).strip().lower() for c in df.columns]
 
+    # Celdas vacías (NaN) -> None en una sola pasada vectorizada y conversión en
+    # bloque a dicts nativos: evita el antipatrón iterrows, que construye una
+    # Series nueva por fila y es varias veces más lento.
+    rows = df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
     profiles: List[Dict[str, Any]] = []
 
-    for _, r in df.iterrows():
-        row = r.to_dict()
+    for row in rows:
         # nombre completo obligatorio
         nombre = row.get('nombre') or 'Sin Nombre'
         cargo = row.get('cargo') or ''
@@ -329,16 +473,18 @@ def load_profiles_from_excel(path: str, photos_dir: str = DEFAULT_PHOTOS_DIR) ->
         # foto
         incluir_foto = _to_bool(row.get('incluir_foto'))
         foto_filename = row.get('foto') or row.get('foto_filename') or row.get('ruta_foto')
+        # se guarda la ruta absoluta tal cual: resolve_photo_path la acepta directamente,
+        # sin el ida y vuelta relpath -> re-join con PROJECT_ROOT por cada fila
+        # (convertir a relativa solo haría falta al serializar perfiles a disco)
         ruta_foto = None
         if foto_filename:
             ruta_foto = _find_photo_by_basename(photos_dir, str(foto_filename).strip())
             if ruta_foto:
-                ruta_foto = os.path.relpath(ruta_foto, PROJECT_ROOT)
                 incluir_foto = True
         if not ruta_foto:
             guess = _find_photo_by_name_guess(photos_dir, nombre)
             if guess:
-                ruta_foto = os.path.relpath(guess, PROJECT_ROOT)
+                ruta_foto = guess
                 incluir_foto = True
 
         resumen = row.get('resumen') or ''
@@ -369,40 +515,56 @@ def load_profiles_from_excel(path: str, photos_dir: str = DEFAULT_PHOTOS_DIR) ->
     return profiles
 
 
-def build_one(profile: Dict[str, Any], outdir: str, process_photos: bool, target_px: int, max_bytes: int):
-    ok, missing = validate_profile(profile)
-    if not ok:
-        print(f"[WARN] Perfil omitido, faltan campos requeridos: {missing}")
-        return
-
-    data = dict(profile)  # copia superficial
+def prepare_photo(profile: Dict[str, Any], process_photos: bool, target_px: int, max_bytes: int) -> Optional[str]:
+    """Resuelve (y opcionalmente procesa) la foto de un perfil. Retorna la ruta final o None.
 
+    Esta etapa es independiente del render .docx: el trabajo pesado (Pillow) libera el GIL,
+    así que puede ejecutarse en un pool de hilos antes de la etapa de render.
+    """
     ruta_foto = resolve_photo_path(profile.get('ruta_foto'))
     incluir_foto = bool(profile.get('incluir_foto'))
 
-    if incluir_foto and not ruta_foto:
+    if not incluir_foto:
+        return None
+
+    if not ruta_foto:
         # intento por nombre
         guess = _find_photo_by_name_guess(DEFAULT_PHOTOS_DIR, profile.get('nombre', ''))
         if guess:
             ruta_foto = guess
         else:
             print("[INFO] 'incluir_foto' es True pero no se encontró 'ruta_foto' válida. Se omitirá la foto.")
+            return None
 
-    if incluir_foto and ruta_foto and process_photos:
+    if process_photos:
         try:
             processed = preprocess_photo(ruta_foto, PROCESSED_DIRNAME, target_size_px=target_px, max_bytes=max_bytes)
-            data['ruta_foto'] = processed
             print(f"[INFO] Foto procesada: {processed}")
+            return processed
         except Exception as e:
             print(f"[WARN] No se pudo procesar la foto '{ruta_foto}': {e}. Se intentará usar la original.")
-            data['ruta_foto'] = ruta_foto
-    else:
-        data['ruta_foto'] = ruta_foto
+    return ruta_foto
+
+
+def render_docx(profile: Dict[str, Any], outdir: str, ruta_foto: Optional[str]):
+    """Genera el .docx de un perfil usando una foto ya resuelta/procesada."""
+    ok, missing = validate_profile(profile)
+    if not ok:
+        print(f"[WARN] Perfil omitido, faltan campos requeridos: {missing}")
+        return
+
+    data = dict(profile)  # copia superficial
+    data['ruta_foto'] = ruta_foto
 
     ensure_dir(outdir)
     construir_cv(data, carpeta_salida=outdir)
 
 
+def build_one(profile: Dict[str, Any], outdir: str, process_photos: bool, target_px: int, max_bytes: int):
+    ruta_foto = prepare_photo(profile, process_photos, target_px, max_bytes)
+    render_docx(profile, outdir, ruta_foto)
+
+
 # ------------------
 # Utilidad: unir JSON extra -> profiles.json
 # ------------------
@@ -415,36 +577,47 @@ def _normalize_perfiles(data: Any) -> List[Dict[str, Any]]:
     raise ValueError('El archivo debe ser lista o {"perfiles": [...]}')
 
 
-def _profile_key_for_merge(p: Dict[str, Any]) -> Tuple[str, str, str]:
+def _profile_key_for_merge(p: Dict[str, Any]) -> Tuple[str, str, bytes]:
     nombre = str(p.get('nombre', '')).strip().lower()
     cargo = str(p.get('cargo', '')).strip().lower()
+    # Huella de 16 bytes en lugar del JSON completo: el set de deduplicación pasa
+    # de O(N·bytes_perfil) a O(N·16) en memoria y las comparaciones son O(1).
     try:
-        fingerprint = json.dumps(p, ensure_ascii=False, sort_keys=True)
+        if orjson is not None:
+            serialized = orjson.dumps(p, option=orjson.OPT_SORT_KEYS)
+        else:
+            serialized = json.dumps(p, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        fingerprint = hashlib.blake2b(serialized, digest_size=16).digest()
     except Exception:
-        fingerprint = nombre + '|' + cargo
+        fingerprint = (nombre + '|' + cargo).encode('utf-8')
     return (nombre, cargo, fingerprint)
 
 
+def _write_profiles_json(path: str, perfiles: List[Dict[str, Any]]):
+    doc = {'perfiles': perfiles}
+    if orjson is not None:
+        # binario + una sola escritura: evita el encoder de texto y el indentado Python
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
+
+
 def merge_extra_into_profiles(extra_path: str, target_path: str) -> int:
     if not os.path.exists(extra_path):
         return 0
-    with open(extra_path, 'r', encoding='utf-8') as f:
-        extra_raw = json.load(f)
-    with open(target_path, 'r', encoding='utf-8') as f:
-        target_raw = json.load(f)
+    extra_raw = load_json(extra_path)
+    target_raw = load_json(target_path)
     extra = _normalize_perfiles(extra_raw)
     target = _normalize_perfiles(target_raw)
-    combined = list(target) + list(extra)
-    seen = set()
-    result: List[Dict[str, Any]] = []
-    for p in combined:
-        k = _profile_key_for_merge(p)
-        if k in seen:
-            continue
-        seen.add(k)
-        result.append(p)
-    with open(target_path, 'w', encoding='utf-8') as f:
-        json.dump({'perfiles': result}, f, ensure_ascii=False, indent=2)
+    # dict con setdefault: deduplica preservando orden de inserción, sin construir
+    # la lista concatenada intermedia (chain itera ambas fuentes sin copiarlas)
+    seen: Dict[Tuple[str, str, bytes], Dict[str, Any]] = {}
+    for p in itertools.chain(target, extra):
+        seen.setdefault(_profile_key_for_merge(p), p)
+    result = list(seen.values())
+    _write_profiles_json(target_path, result)
     return len(result)
 
 
@@ -494,16 +667,10 @@ def main():
             extra_doc = load_json(DEFAULT_EXTRA_FILE)
             perfiles_extra = normalize_profiles(extra_doc)
             before = len(perfiles)
-            combined = perfiles + perfiles_extra
-            seen = set()
-            dedup: List[Dict[str, Any]] = []
-            for p in combined:
-                k = _profile_key_for_merge(p)
-                if k in seen:
-                    continue
-                seen.add(k)
-                dedup.append(p)
-            perfiles = dedup
+            seen: Dict[Tuple[str, str, bytes], Dict[str, Any]] = {}
+            for p in itertools.chain(perfiles, perfiles_extra):
+                seen.setdefault(_profile_key_for_merge(p), p)
+            perfiles = list(seen.values())
             print(f"[INFO] Añadidos {len(perfiles) - before} perfiles extra desde {os.path.relpath(DEFAULT_EXTRA_FILE, PROJECT_ROOT)}. Total: {len(perfiles)}")
         except Exception as e:
             print(f"[WARN] No se pudo combinar el extra: {e}")
@@ -512,13 +679,41 @@ def main():
         print('[ERROR] --process-photos requiere Pillow. Instálalo manualmente: pip install Pillow')
         sys.exit(2)
 
+    max_workers = os.cpu_count() or 1
+
+    # Etapa 1: fotos. Pillow libera el GIL en el encoder JPEG, así que un pool de
+    # hilos aprovecha todos los cores sin el costo de serializar perfiles a procesos.
+    photo_worker = functools.partial(
+        prepare_photo,
+        process_photos=args.process_photos,
+        target_px=args.target_size,
+        max_bytes=args.max_bytes,
+    )
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        photo_futures = [pool.submit(photo_worker, p) for p in perfiles]
+        fotos = []
+        for fut in photo_futures:
+            try:
+                fotos.append(fut.result())
+            except Exception as e:
+                # un perfil con foto rota no debe tumbar el lote: se sigue sin foto
+                print(f"[WARN] Falló la preparación de la foto de un perfil: {e}")
+                fotos.append(None)
+
+    # Etapa 2: render .docx. Cada perfil escribe un archivo independiente (sin estado
+    # compartido) y el trabajo es CPU-bound (serialización XML), por lo que procesos > hilos.
     count = 0
-    for p in perfiles:
-        try:
-            build_one(p, args.outdir, args.process_photos, args.target_size, args.max_bytes)
-            count += 1
-        except Exception as e:
-            print(f"[ERROR] Falló la generación de un CV: {e}")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(render_docx, p, args.outdir, foto)
+            for p, foto in zip(perfiles, fotos)
+        ]
+        for fut in concurrent.futures.as_completed(futures):
+            try:
+                fut.result()
+                count += 1
+            except Exception as e:
+                print(f"[ERROR] Falló la generación de un CV: {e}")
 
     print(f"Listo. CVs generados: {count} -> {args.outdir}")
 
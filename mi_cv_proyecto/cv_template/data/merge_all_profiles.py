@@ -18,11 +18,22 @@ Reglas:
 """
 import argparse
 import glob
+import hashlib
 import json
 import os
 import sys
 from typing import Any, Dict, Iterable, List, Tuple
 
+try:
+    import orjson  # opcional: parse/serialización JSON mucho más rápidos
+except Exception:
+    orjson = None
+
+try:
+    import ijson  # opcional: parse JSON en streaming (memoria ~constante)
+except Exception:
+    ijson = None
+
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'cv_template', 'data')
 DEFAULT_TARGET = os.path.join(DATA_DIR, 'profiles.json')
@@ -37,6 +48,9 @@ EXCLUDE_BASENAMES = {
 
 
 def _load_json(path: str) -> Any:
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -54,64 +68,120 @@ def _normalize_perfiles(doc: Any) -> List[Dict[str, Any]]:
     return []
 
 
-def _profile_key(p: Dict[str, Any]) -> Tuple[str, str, str]:
+def _profile_key(p: Dict[str, Any]) -> Tuple[str, str, bytes]:
     nombre = str(p.get('nombre', '')).strip().lower()
     cargo = str(p.get('cargo', '')).strip().lower()
+    # Huella de 16 bytes en lugar del JSON completo: el set de deduplicación pasa
+    # de O(N·bytes_perfil) a O(N·16) en memoria y las comparaciones son O(1).
     try:
-        fingerprint = json.dumps(p, ensure_ascii=False, sort_keys=True)
+        if orjson is not None:
+            serialized = orjson.dumps(p, option=orjson.OPT_SORT_KEYS)
+        else:
+            serialized = json.dumps(p, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        fingerprint = hashlib.blake2b(serialized, digest_size=16).digest()
     except Exception:
-        fingerprint = nombre + '|' + cargo
+        fingerprint = (nombre + '|' + cargo).encode('utf-8')
     return (nombre, cargo, fingerprint)
 
 
+def _iter_perfiles_file(path: str) -> Iterable[Dict[str, Any]]:
+    """Itera los perfiles de un archivo JSON.
+
+    Con ijson disponible, los archivos {"perfiles": [...]} y las listas directas se
+    recorren en streaming, de modo que la memoria no depende del tamaño del archivo.
+    Sin ijson, o para el formato de perfil único como objeto, cae al parse completo.
+    """
+    if ijson is not None:
+        with open(path, 'rb') as f:
+            first = f.read(64).lstrip()[:1]
+            f.seek(0)
+            prefix = 'item' if first == b'[' else 'perfiles.item'
+            emitted = False
+            # use_float: sin esto ijson emite Decimal y la escritura final
+            # (orjson.dumps / json.dump) rechaza los perfiles con floats
+            for p in ijson.items(f, prefix, use_float=True):
+                if isinstance(p, dict):
+                    emitted = True
+                    yield p
+            if emitted or first == b'[':
+                return
+        # objeto sin clave "perfiles": puede ser un perfil único -> parse completo
+    for p in _normalize_perfiles(_load_json(path)):
+        yield p
+
+
+def _looks_like_profiles_json(path: str) -> bool:
+    """Pre-filtro barato: busca las claves '"perfiles"' o '"nombre"' en los primeros
+    4 KB del archivo. Descarta catálogos auxiliares sin pagar el parse completo."""
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return False
+    return b'"perfiles"' in head or b'"nombre"' in head
+
+
 def _iter_candidate_files() -> Iterable[str]:
     pattern = os.path.join(DATA_DIR, '*.json')
     for path in glob.glob(pattern):
         base = os.path.basename(path)
         if base in EXCLUDE_BASENAMES:
             continue
+        if not _looks_like_profiles_json(path):
+            print(f"[INFO] Sin pinta de perfiles (pre-filtro), se omite: {base}")
+            continue
         yield path
 
 
 def merge_files(input_files: List[str], target_path: str) -> int:
-    all_profiles: List[Dict[str, Any]] = []
+    # Los perfiles se consumen en streaming archivo por archivo, deduplicando al vuelo:
+    # en memoria solo viven el set de huellas y la lista de resultado.
+    seen = set()
+    result: List[Dict[str, Any]] = []
 
-    for inp in input_files:
-        try:
-            doc = _load_json(inp)
-            perf = _normalize_perfiles(doc)
-            if not perf:
-                print(f"[INFO] Sin perfiles válidos, se omite: {inp}")
+    def _consume(path: str) -> int:
+        # buffer local por archivo: si el parse falla a mitad, no se incorpora su
+        # prefijo parcial (atomicidad por archivo, memoria acotada a un archivo)
+        pending: List[Dict[str, Any]] = []
+        pending_keys = set()
+        for p in _iter_perfiles_file(path):
+            k = _profile_key(p)
+            if k in seen or k in pending_keys:
                 continue
-            all_profiles.extend(perf)
-            print(f"[OK] {len(perf)} perfiles desde {os.path.basename(inp)}")
-        except Exception as e:
-            print(f"[WARN] No se pudo leer {inp}: {e}")
+            pending_keys.add(k)
+            pending.append(p)
+        seen.update(pending_keys)
+        result.extend(pending)
+        return len(pending)
 
-    # si ya existe target, incluirlo primero para priorizar su orden
+    # si ya existe target, procesarlo primero para priorizar su orden
     if os.path.exists(target_path):
         try:
-            doc = _load_json(target_path)
-            perf = _normalize_perfiles(doc)
-            if perf:
-                all_profiles = perf + all_profiles
-                print(f"[OK] Se preservan {len(perf)} perfiles existentes en {os.path.basename(target_path)}")
+            kept = _consume(target_path)
+            if kept:
+                print(f"[OK] Se preservan {kept} perfiles existentes en {os.path.basename(target_path)}")
         except Exception as e:
             print(f"[WARN] No se pudo leer existente {target_path}: {e}")
 
-    # deduplicar
-    seen = set()
-    result: List[Dict[str, Any]] = []
-    for p in all_profiles:
-        k = _profile_key(p)
-        if k in seen:
-            continue
-        seen.add(k)
-        result.append(p)
+    for inp in input_files:
+        try:
+            added = _consume(inp)
+            if added:
+                print(f"[OK] {added} perfiles desde {os.path.basename(inp)}")
+            else:
+                print(f"[INFO] Sin perfiles válidos (o ya presentes), se omite: {inp}")
+        except Exception as e:
+            print(f"[WARN] No se pudo leer {inp}: {e}")
 
     os.makedirs(os.path.dirname(target_path), exist_ok=True)
-    with open(target_path, 'w', encoding='utf-8') as f:
-        json.dump({'perfiles': result}, f, ensure_ascii=False, indent=2)
+    doc = {'perfiles': result}
+    if orjson is not None:
+        # binario + una sola escritura: evita el encoder de texto y el indentado Python
+        with open(target_path, 'wb') as f:
+            f.write(orjson.dumps(doc, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(target_path, 'w', encoding='utf-8') as f:
+            json.dump(doc, f, ensure_ascii=False, indent=2)
 
     print(f"[DONE] Perfiles combinados: {len(result)} -> {target_path}")
     return len(result)
@@ -8,10 +8,16 @@ Pillow es OPCIONAL (solo si quieres recortar/estandarizar la foto antes de inser
 Salida: output/CV_<Nombre>_<Apellido>_<Año>.docx
 """
 
+import concurrent.futures
+import copy
+import functools
+import hashlib
+import io
 import os
 from datetime import datetime
 from docx import Document
-from docx.shared import Pt, Cm
+from docx.shared import Pt, Cm, RGBColor
+from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.oxml.shared import OxmlElement, qn
 
@@ -23,11 +29,24 @@ PRIMARY_HEX = "2F80ED"        # Acento profesional (azul petróleo)
 FONT_FAMILY = "Calibri"       # ATS-friendly
 MARGIN_CM = 2.0               # Márgenes simétricos (ATS + legible)
 PHOTO_WIDTH_CM = 3.5          # Ancho visual sugerido para foto en el documento
+_PHOTO_WIDTH = Cm(PHOTO_WIDTH_CM)  # construido una sola vez; se reutiliza por foto
 
 
 # -----------------------------
 # Utilidades de estilo
 # -----------------------------
+# qn() de nombres usados en rutas calientes, resueltos una sola vez al importar
+_QN_RPR = qn('w:rPr')
+_QN_VAL = qn('w:val')
+_QN_SZ = qn('w:sz')
+_QN_SPACE = qn('w:space')
+_QN_COLOR = qn('w:color')
+_QN_AFTER = qn('w:after')
+_QN_LEFT = qn('w:left')
+_QN_SECTPR = qn('w:sectPr')
+_QN_XML_SPACE = qn('xml:space')
+
+
 def set_margins(section, left=MARGIN_CM, right=MARGIN_CM, top=MARGIN_CM, bottom=MARGIN_CM):
     section.left_margin = Cm(left)
     section.right_margin = Cm(right)
@@ -35,22 +54,54 @@ def set_margins(section, left=MARGIN_CM, right=MARGIN_CM, top=MARGIN_CM, bottom=
     section.bottom_margin = Cm(bottom)
 
 
+# Fragmentos w:rPr prearmados por combinación (size, bold, color, familia): aplicar
+# estilo a un run pasa a ser un deepcopy de un subárbol en vez de 4-5 mutaciones lxml
+# vía los setters de python-docx.
+_RPR_CACHE = {}
+
+
+def _cached_rpr(size, bold, color_rgb, font_family):
+    key = (size, bold, color_rgb, font_family)
+    rpr = _RPR_CACHE.get(key)
+    if rpr is None:
+        rpr = OxmlElement('w:rPr')
+        rfonts = OxmlElement('w:rFonts')
+        # Asegurar font también en EastAsia para MS Word
+        for attr in ('w:ascii', 'w:hAnsi', 'w:eastAsia'):
+            rfonts.set(qn(attr), font_family)
+        rpr.append(rfonts)
+        if bold:
+            rpr.append(OxmlElement('w:b'))
+        if color_rgb:
+            color = OxmlElement('w:color')
+            color.set(qn('w:val'), '%02X%02X%02X' % tuple(color_rgb))
+            rpr.append(color)
+        half_points = str(int(size * 2))  # w:sz va en medios puntos
+        for tag in ('w:sz', 'w:szCs'):
+            sz = OxmlElement(tag)
+            sz.set(qn('w:val'), half_points)
+            rpr.append(sz)
+        _RPR_CACHE[key] = rpr
+    return copy.deepcopy(rpr)
+
+
 def set_run_style(run, size=11, bold=False, color_rgb=None, font_family=FONT_FAMILY):
-    run.font.name = font_family
-    # Asegurar font en EastAsia para MS Word
-    run._element.rPr.rFonts.set(qn('w:eastAsia'), font_family)
-    run.font.size = Pt(size)
-    run.bold = bold
-    if color_rgb:
-        from docx.shared import RGBColor
-        run.font.color.rgb = RGBColor(*color_rgb)
+    r = run._r
+    old = r.find(_QN_RPR)
+    if old is not None:
+        r.remove(old)
+    r.insert(0, _cached_rpr(size, bold, tuple(color_rgb) if color_rgb else None, font_family))
 
 
+@functools.lru_cache(maxsize=64)
 def _hex_to_rgb_tuple(hexstr):
     hexstr = hexstr.replace("#", "")
     return tuple(int(hexstr[i:i+2], 16) for i in (0, 2, 4))
 
 
+_PRIMARY_RGB = _hex_to_rgb_tuple(PRIMARY_HEX)
+
+
 def add_colored_divider(paragraph, color_hex=PRIMARY_HEX, size=6, space=1):
     """
     Inserta una línea divisoria (borde inferior) al párrafo, sin usar tablas (mejor para ATS).
@@ -61,42 +112,77 @@ def add_colored_divider(paragraph, color_hex=PRIMARY_HEX, size=6, space=1):
     pBdr = OxmlElement('w:pBdr')
 
     bottom = OxmlElement('w:bottom')
-    bottom.set(qn('w:val'), 'single')
-    bottom.set(qn('w:sz'), str(size))
-    bottom.set(qn('w:space'), str(space))
-    bottom.set(qn('w:color'), color_hex.replace("#", ""))
+    bottom.set(_QN_VAL, 'single')
+    bottom.set(_QN_SZ, str(size))
+    bottom.set(_QN_SPACE, str(space))
+    bottom.set(_QN_COLOR, color_hex.replace("#", ""))
     pBdr.append(bottom)
 
     pPr.append(pBdr)
 
 
 def add_section_title(doc, text, color_hex=PRIMARY_HEX):
-    p = doc.add_paragraph()
-    p.paragraph_format.space_before = Pt(16)
-    p.paragraph_format.space_after = Pt(4)
-    run = p.add_run(text.upper())
-    set_run_style(run, size=12, bold=True)
+    # el formato (fuente, negrita, espaciados) viene del estilo registrado en la plantilla
+    p = doc.add_paragraph(text.upper(), style='CV-SectionTitle')
     # Línea de acento debajo del título
     add_colored_divider(p, color_hex=color_hex, size=10, space=5)
 
 
+def _build_bullet_p(text, style_id, indent_twips, space_after_twips=None):
+    """Arma un w:p de viñeta directamente en lxml (pStyle + ind + run), evitando el
+    bookkeeping por párrafo de python-docx. Fuente y espaciado los aporta el estilo."""
+    p = OxmlElement('w:p')
+    ppr = OxmlElement('w:pPr')
+    pstyle = OxmlElement('w:pStyle')
+    pstyle.set(_QN_VAL, style_id)
+    ppr.append(pstyle)
+    if space_after_twips is not None:
+        spacing = OxmlElement('w:spacing')
+        spacing.set(_QN_AFTER, space_after_twips)
+        ppr.append(spacing)
+    ind = OxmlElement('w:ind')
+    ind.set(_QN_LEFT, indent_twips)
+    ppr.append(ind)
+    p.append(ppr)
+    r = OxmlElement('w:r')
+    t = OxmlElement('w:t')
+    t.set(_QN_XML_SPACE, 'preserve')
+    t.text = text
+    r.append(t)
+    p.append(r)
+    return p
+
+
+@functools.lru_cache(maxsize=8)
+def _indent_twips(cm):
+    # solo se usan un par de sangrías (0.4/0.5 cm); memoizar evita rehacer Cm por lista
+    return str(int(Cm(cm).twips))
+
+
 def add_bullets(doc, items, left_indent_cm=0.5, space_after_pt=2):
-    for it in items or []:
-        p = doc.add_paragraph(style='List Bullet')
-        p.paragraph_format.left_indent = Cm(left_indent_cm)
-        p.paragraph_format.space_after = Pt(space_after_pt)
-        run = p.add_run(it)
-        set_run_style(run, size=10.5)
+    if not items:
+        return
+    # resolver el estilo y los twips una sola vez por lista, no por ítem
+    style_id = doc.styles['CV-Bullet'].style_id
+    indent_twips = _indent_twips(left_indent_cm)
+    # el estilo ya trae space_after=2pt; solo se emite inline si difiere
+    space_after_twips = None if space_after_pt == 2 else str(int(space_after_pt * 20))
+    body = doc.element.body
+    sect_pr = body.find(_QN_SECTPR)
+    for it in items:
+        p = _build_bullet_p(it, style_id, indent_twips, space_after_twips)
+        if sect_pr is not None:
+            sect_pr.addprevious(p)
+        else:
+            body.append(p)
 
 
 def _add_header_text_block(container, nombre, cargo, contacto, ubicacion=None):
     # contenedor es un Document o una celda de tabla (tiene add_paragraph)
-    p_name = container.add_paragraph()
+    p_name = container.add_paragraph(nombre, style='CV-Name')
     p_name.alignment = WD_ALIGN_PARAGRAPH.LEFT
-    set_run_style(p_name.add_run(nombre), size=20, bold=True)
 
-    p_role = container.add_paragraph()
-    set_run_style(p_role.add_run(cargo), size=12, bold=False, color_rgb=_hex_to_rgb_tuple(PRIMARY_HEX))
+    container.add_paragraph(cargo, style='CV-Role')
 
     # Filtrar LinkedIn de los datos de contacto
     def _is_linkedin(s: str) -> bool:
@@ -106,9 +192,82 @@ def _add_header_text_block(container, nombre, cargo, contacto, ubicacion=None):
     contact_line = " | ".join(contacts_clean)  # email | móvil | web (sin LinkedIn)
     if ubicacion:
         contact_line = f"{contact_line} | {ubicacion}" if contact_line else ubicacion
-    p_contact = container.add_paragraph(contact_line)
-    for run in p_contact.runs:
-        set_run_style(run, size=10.5)
+    container.add_paragraph(contact_line, style='CV-Detail')
+
+
+# Ancho visual de la foto a 300 DPI (~413 px): más resolución solo infla el .docx
+_PHOTO_TARGET_PX = int(PHOTO_WIDTH_CM / 2.54 * 300)
+_PHOTO_MAX_EMBED_BYTES = 64 * 1024
+_PHOTO_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'output', '.cache')
+# Salida de preprocess_photo (batch_generate_cv --process-photos): esas fotos ya
+# respetan el --target-size/--max-bytes del usuario y no deben recomprimirse aquí.
+_PHOTO_PREPROCESSED_DIRNAME = '_photos_processed'
+
+
+def _preparar_foto(path):
+    if os.path.basename(os.path.dirname(os.path.abspath(path))) == _PHOTO_PREPROCESSED_DIRNAME:
+        return path
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return path
+    return _preparar_foto_cached(path, mtime)
+
+
+@functools.lru_cache(maxsize=64)
+def _preparar_foto_cached(path, mtime):
+    """Reduce/recomprime la foto al tamaño visual real antes de incrustarla (una foto
+    de smartphone de varios MB infla cada .docx generado). Cachea el resultado en
+    output/.cache; si Pillow no está o algo falla, se incrusta la original."""
+    try:
+        from PIL import Image
+    except Exception:
+        return path
+    try:
+        if os.path.getsize(path) <= _PHOTO_MAX_EMBED_BYTES:
+            with Image.open(path) as im:
+                if im.width <= _PHOTO_TARGET_PX and im.height <= _PHOTO_TARGET_PX:
+                    return path
+        key = hashlib.sha1(f"{os.path.abspath(path)}:{mtime}".encode()).hexdigest()
+        out = os.path.join(_PHOTO_CACHE_DIR, f"{key}.jpg")
+        if os.path.exists(out):
+            return out
+        os.makedirs(_PHOTO_CACHE_DIR, exist_ok=True)
+        resample = getattr(Image, 'Resampling', Image).LANCZOS
+        with Image.open(path) as im:
+            if im.mode in ('RGBA', 'LA') or (im.mode == 'P' and 'transparency' in im.info):
+                # componer el alfa sobre blanco: convert('RGB') lo aplasta sobre negro
+                im = im.convert('RGBA')
+                bg = Image.new('RGB', im.size, 'white')
+                bg.paste(im, mask=im.getchannel('A'))
+                im = bg
+            elif im.mode != 'RGB':
+                im = im.convert('RGB')
+            im.thumbnail((_PHOTO_TARGET_PX, _PHOTO_TARGET_PX * 2), resample)
+            im.save(out, format='JPEG', quality=82, optimize=True)
+        return out
+    except Exception:
+        return path
+
+
+@functools.lru_cache(maxsize=16)
+def _photo_bytes(path, mtime):
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _photo_stream(path):
+    """Bytes de la foto cacheados por (ruta, mtime): en un lote que comparte foto/logo
+    el archivo se lee de disco una sola vez. Devuelve la ruta si no se pudo leer."""
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return path
+    data = _photo_bytes(path, mtime)
+    return io.BytesIO(data) if data is not None else path
 
 
 def add_header(doc, nombre, cargo, contacto, ubicacion=None, incluir_foto=False, ruta_foto=None, photo_position='right_paragraph'):
@@ -120,7 +279,12 @@ def add_header(doc, nombre, cargo, contacto, ubicacion=None, incluir_foto=False,
     """
     use_table = photo_position in ('right_table', 'left_table')
 
-    if incluir_foto and ruta_foto and os.path.exists(ruta_foto) and use_table:
+    # una sola comprobación de existencia; las ramas de abajo reutilizan photo_ok
+    photo_ok = bool(incluir_foto and ruta_foto and os.path.exists(ruta_foto))
+    if photo_ok:
+        ruta_foto = _preparar_foto(ruta_foto)
+
+    if photo_ok and use_table:
         table = doc.add_table(rows=1, cols=2)
         table.autofit = True
         left_cell = table.rows[0].cells[0]
@@ -131,39 +295,35 @@ def add_header(doc, nombre, cargo, contacto, ubicacion=None, incluir_foto=False,
             p_photo = right_cell.paragraphs[0]
             p_photo.alignment = WD_ALIGN_PARAGRAPH.RIGHT
             try:
-                p_photo.add_run().add_picture(ruta_foto, width=Cm(PHOTO_WIDTH_CM))
+                p_photo.add_run().add_picture(_photo_stream(ruta_foto), width=_PHOTO_WIDTH)
             except Exception as ex:
-                err = right_cell.add_paragraph(f"(No se pudo insertar la foto: {ex})")
-                for r in err.runs: set_run_style(r, size=9)
+                err = right_cell.add_paragraph()
+                set_run_style(err.add_run(f"(No se pudo insertar la foto: {ex})"), size=9)
         else:  # left_table
             p_photo = left_cell.paragraphs[0]
             p_photo.alignment = WD_ALIGN_PARAGRAPH.LEFT
             try:
-                p_photo.add_run().add_picture(ruta_foto, width=Cm(PHOTO_WIDTH_CM))
+                p_photo.add_run().add_picture(_photo_stream(ruta_foto), width=_PHOTO_WIDTH)
             except Exception as ex:
-                err = left_cell.add_paragraph(f"(No se pudo insertar la foto: {ex})")
-                for r in err.runs: set_run_style(r, size=9)
+                err = left_cell.add_paragraph()
+                set_run_style(err.add_run(f"(No se pudo insertar la foto: {ex})"), size=9)
             _add_header_text_block(right_cell, nombre, cargo, contacto, ubicacion)
     else:
         # Encabezado sin tabla (ATS-friendly): texto y, opcionalmente, foto en párrafo derecho
         _add_header_text_block(doc, nombre, cargo, contacto, ubicacion)
-        if incluir_foto and ruta_foto and os.path.exists(ruta_foto):
+        if photo_ok:
             p_photo = doc.add_paragraph()
             p_photo.alignment = WD_ALIGN_PARAGRAPH.RIGHT
             try:
-                p_photo.add_run().add_picture(ruta_foto, width=Cm(PHOTO_WIDTH_CM))
+                p_photo.add_run().add_picture(_photo_stream(ruta_foto), width=_PHOTO_WIDTH)
             except Exception as ex:
-                p_err = doc.add_paragraph(f"(No se pudo insertar la foto: {ex})")
-                for run in p_err.runs:
-                    set_run_style(run, size=9)
+                p_err = doc.add_paragraph()
+                set_run_style(p_err.add_run(f"(No se pudo insertar la foto: {ex})"), size=9)
 
 
 def add_resumen(doc, texto):
     add_section_title(doc, "Resumen profesional")
-    p = doc.add_paragraph()
-    p.paragraph_format.space_after = Pt(4)
-    run = p.add_run(texto)
-    set_run_style(run, size=11)
+    doc.add_paragraph(texto, style='CV-Body')
 
 
 def add_experiencia(doc, experiencias):
@@ -171,57 +331,90 @@ def add_experiencia(doc, experiencias):
     for exp in experiencias or []:
         # Encabezado del puesto
         header = f"{exp['puesto']} – {exp['empresa']} | {exp['periodo']}"
-        p = doc.add_paragraph()
-        set_run_style(p.add_run(header), size=11.5, bold=True)
+        doc.add_paragraph(header, style='CV-ItemTitle')
 
         # Subtítulo (opcional)
         subt = []
         if exp.get('ubicacion'): subt.append(exp['ubicacion'])
         if exp.get('sector'): subt.append(exp['sector'])
         if subt:
-            p2 = doc.add_paragraph(" / ".join(subt))
-            for r in p2.runs: set_run_style(r, size=10)
+            p2 = doc.add_paragraph()
+            set_run_style(p2.add_run(" / ".join(subt)), size=10)
 
         # Bloques
         if exp.get('logros'):
-            p3 = doc.add_paragraph()
-            set_run_style(p3.add_run("Logros:"), size=10.5, bold=True)
+            doc.add_paragraph("Logros:", style='CV-Label')
             add_bullets(doc, exp['logros'])
         if exp.get('actividades'):
-            p4 = doc.add_paragraph()
-            set_run_style(p4.add_run("Actividades:"), size=10.5, bold=True)
+            doc.add_paragraph("Actividades:", style='CV-Label')
             add_bullets(doc, exp['actividades'])
         if exp.get('proyectos'):
-            p5 = doc.add_paragraph()
-            set_run_style(p5.add_run("Proyectos:"), size=10.5, bold=True)
+            doc.add_paragraph("Proyectos:", style='CV-Label')
             add_bullets(doc, exp['proyectos'])
 
 
 def add_educacion(doc, items):
     add_section_title(doc, "Educación")
     for ed in items or []:
-        p = doc.add_paragraph()
-        set_run_style(p.add_run(f"{ed['grado']} – {ed['institucion']}"), size=11.5, bold=True)
+        doc.add_paragraph(f"{ed['grado']} – {ed['institucion']}", style='CV-ItemTitle')
         if ed.get('detalle'):
-            p2 = doc.add_paragraph(ed['detalle'])
-            for r in p2.runs: set_run_style(r, size=10.5)
+            doc.add_paragraph(ed['detalle'], style='CV-Detail')
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_bullet_section(title, items, indent_twips):
+    """Elementos (título con divisor + viñetas) de una sección de lista, construidos
+    una sola vez por contenido. Secciones idénticas entre CVs del lote (habilidades,
+    idiomas, certificaciones repetidas) se clonan en vez de rearmarse."""
+    tp = OxmlElement('w:p')
+    ppr = OxmlElement('w:pPr')
+    pstyle = OxmlElement('w:pStyle')
+    pstyle.set(_QN_VAL, 'CV-SectionTitle')
+    ppr.append(pstyle)
+    pbdr = OxmlElement('w:pBdr')
+    bottom = OxmlElement('w:bottom')
+    bottom.set(_QN_VAL, 'single')
+    bottom.set(_QN_SZ, '10')
+    bottom.set(_QN_SPACE, '5')
+    bottom.set(_QN_COLOR, PRIMARY_HEX)
+    pbdr.append(bottom)
+    ppr.append(pbdr)
+    tp.append(ppr)
+    r = OxmlElement('w:r')
+    t = OxmlElement('w:t')
+    t.set(_QN_XML_SPACE, 'preserve')
+    t.text = title.upper()
+    r.append(t)
+    tp.append(r)
+    elems = [tp]
+    for it in items:
+        elems.append(_build_bullet_p(it, 'CV-Bullet', indent_twips))
+    return tuple(elems)
+
+
+def _append_cached_section(doc, title, items, left_indent_cm=0.4):
+    body = doc.element.body
+    sect_pr = body.find(_QN_SECTPR)
+    for el in _cached_bullet_section(title, items, _indent_twips(left_indent_cm)):
+        el = copy.deepcopy(el)
+        if sect_pr is not None:
+            sect_pr.addprevious(el)
+        else:
+            body.append(el)
 
 
 def add_certificaciones(doc, certs):
     if not certs: return
-    add_section_title(doc, "Certificaciones")
-    add_bullets(doc, certs, left_indent_cm=0.4)
+    _append_cached_section(doc, "Certificaciones", tuple(certs))
 
 
 def add_habilidades(doc, skills):
-    add_section_title(doc, "Habilidades")
-    add_bullets(doc, skills, left_indent_cm=0.4)
+    _append_cached_section(doc, "Habilidades", tuple(skills or ()))
 
 
 def add_idiomas(doc, idiomas):
-    add_section_title(doc, "Idiomas")
-    pairs = [f"{k}: {v}" for k, v in (idiomas or {}).items()]
-    add_bullets(doc, pairs, left_indent_cm=0.4)
+    pairs = tuple(f"{k}: {v}" for k, v in (idiomas or {}).items())
+    _append_cached_section(doc, "Idiomas", pairs)
 
 
 # -----------------------------
@@ -300,11 +493,65 @@ def demo_data():
 # -----------------------------
 # Generación del documento
 # -----------------------------
+# Estilos de párrafo propios: (nombre, size, bold, color_rgb, estilo_base)
+# Los runs que los usan no llevan rPr inline; Word resuelve el formato desde styles.xml.
+_CV_STYLES = (
+    ('CV-Name', 20, True, None, None),
+    ('CV-Role', 12, False, _PRIMARY_RGB, None),
+    ('CV-SectionTitle', 12, True, None, None),
+    ('CV-Body', 11, False, None, None),
+    ('CV-Detail', 10.5, False, None, None),
+    ('CV-Label', 10.5, True, None, None),
+    ('CV-ItemTitle', 11.5, True, None, None),
+    ('CV-Bullet', 10.5, False, None, 'List Bullet'),
+)
+
+
+def _registrar_estilos(doc):
+    styles = doc.styles
+    for nombre, size, bold, color_rgb, base in _CV_STYLES:
+        st = styles.add_style(nombre, WD_STYLE_TYPE.PARAGRAPH)
+        if base:
+            st.base_style = styles[base]
+        font = st.font
+        font.name = FONT_FAMILY
+        font.size = Pt(size)
+        font.bold = bold
+        if color_rgb:
+            font.color.rgb = RGBColor(*color_rgb)
+        # asegurar font en EastAsia para MS Word
+        st.element.get_or_add_rPr().rFonts.set(qn('w:eastAsia'), FONT_FAMILY)
+
+    # formato de párrafo que antes se aplicaba inline en cada CV
+    titulo = styles['CV-SectionTitle'].paragraph_format
+    titulo.space_before = Pt(16)
+    titulo.space_after = Pt(4)
+    styles['CV-Body'].paragraph_format.space_after = Pt(4)
+    styles['CV-Bullet'].paragraph_format.space_after = Pt(2)
+
+
+@functools.lru_cache(maxsize=1)
+def _plantilla_base() -> bytes:
+    """Construye y parsea la plantilla base (documento en blanco + márgenes + estilos
+    CV-*) una sola vez por proceso. Document() relee y parsea el .docx por defecto en
+    cada llamada; cachear el paquete serializado evita ese costo fijo en lotes de CVs."""
+    doc = Document()
+    set_margins(doc.sections[0])
+    _registrar_estilos(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+def _nuevo_documento():
+    """Documento nuevo instanciado desde la plantilla base cacheada (en memoria)."""
+    return Document(io.BytesIO(_plantilla_base()))
+
+
 def construir_cv(data, carpeta_salida="output"):
     os.makedirs(carpeta_salida, exist_ok=True)
 
-    doc = Document()
-    set_margins(doc.sections[0])
+    doc = _nuevo_documento()
 
     add_header(
         doc,
@@ -327,10 +574,27 @@ def construir_cv(data, carpeta_salida="output"):
     safe_name = data["nombre"].strip().replace(" ", "_")
     out_name = f"CV_{safe_name}_{datetime.now().year}.docx"
     out_path = os.path.join(carpeta_salida, out_name)
-    doc.save(out_path)
+    # serializar el zip en memoria y volcarlo en una sola escritura secuencial,
+    # en vez de las muchas escrituras pequeñas de zipfile directo a disco
+    buf = io.BytesIO()
+    doc.save(buf)
+    with open(out_path, 'wb') as f:
+        f.write(buf.getbuffer())
     print(f"Documento generado: {out_path}")
 
 
+def construir_cvs(batch, carpeta_salida="output", workers=None):
+    """Genera los CVs de `batch` (lista de dicts de perfil) en paralelo.
+
+    Cada documento es independiente y el render es CPU-bound (lxml/zip), así que se
+    reparte en procesos: con `workers=None` usa un proceso por core. Cada worker paga
+    una sola vez el costo de la plantilla base cacheada.
+    """
+    worker = functools.partial(construir_cv, carpeta_salida=carpeta_salida)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(worker, batch))
+
+
 if __name__ == "__main__":
     data = demo_data()
     construir_cv(data)